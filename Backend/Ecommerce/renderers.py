@@ -0,0 +1,25 @@
+import orjson
+from rest_framework import renderers
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson. Types orjson can't encode natively
+    (Decimal, lazy strings, querysets) go through DRF's encoder, and indented
+    or ASCII-only output is left to JSONRenderer itself.
+
+    STRICT_JSON is not enforced: orjson writes NaN and Infinity as null
+    instead of raising.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.ensure_ascii or self.get_indent(accepted_media_type, renderer_context) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=orjson.OPT_NON_STR_KEYS)
+        # Like JSONRenderer, escape U+2028 and U+2029 so the output is also valid JavaScript
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
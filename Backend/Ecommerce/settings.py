@@ -27,9 +27,11 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = env('SECRET_KEY')
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# DEBUG also makes Django record every SQL query in connection.queries.
+# Set DEBUG=True in .env for local development; /media/ is only served then.
+DEBUG = env.bool('DEBUG', default=False)
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = env.list('ALLOWED_HOSTS', default=['localhost', '127.0.0.1'])
 
 
 # Application definition
@@ -63,6 +65,10 @@ ROOT_URLCONF = 'Ecommerce.urls'
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'accounts.tokenAuthentication.JWTAuthentication'
+    ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'Ecommerce.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
     ]
 }
 
@@ -97,12 +103,21 @@ DATABASES = {
         'PASSWORD': env('DATABASE_PASSWORD'),  
         'HOST': '127.0.0.1',  
         'PORT': '3306',  
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {  
             'init_command': "SET sql_mode='STRICT_TRANS_TABLES'" 
         }
     }
 }
 
+# Cached list responses are invalidated by writing a generation key, which
+# every worker has to see. locmem is per process, so outside DEBUG CACHE_URL
+# must name a shared backend such as redis://127.0.0.1:6379/1.
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://' if DEBUG else env.NOTSET),
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
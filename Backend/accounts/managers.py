@@ -3,7 +3,7 @@ from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 import re
 
-PHONE_REGEX = r"(^923[0-9]{9}$)"
+PHONE_REGEX = re.compile(r"923[0-9]{9}")
 
 class CustomUserManager(BaseUserManager):
     def create_user(self, phone, password, **extra_fields):
@@ -38,6 +38,4 @@ class CustomUserManager(BaseUserManager):
             raise ValidationError(_('Phone number must be in the format 923xxxxxxxxx'))
 
     def validate_phone(self, phone):
-        if len(phone) == 12 and re.match(PHONE_REGEX, phone):
-            return True
-        return False
+        return PHONE_REGEX.fullmatch(phone) is not None
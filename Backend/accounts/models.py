@@ -4,12 +4,11 @@ from django.db import models
 from .managers import CustomUserManager
 
 class CustomUser(AbstractUser):
-    USER_TYPE_CHOICES = (
-        ('customer', 'Customer'),
-        ('admin', 'Admin'),
-        ('seller', 'Seller'),
-    )
-    
+    class UserType(models.TextChoices):
+        CUSTOMER = 'customer', 'Customer'
+        ADMIN = 'admin', 'Admin'
+        SELLER = 'seller', 'Seller'
+
     username = None
     first_name = models.CharField(
         max_length=255,
@@ -36,8 +35,8 @@ class CustomUser(AbstractUser):
     date_of_birth = models.DateField(blank=True, null=True)
     user_type = models.CharField(
         max_length=10,
-        choices=USER_TYPE_CHOICES,
-        default='customer'
+        choices=UserType.choices,
+        default=UserType.CUSTOMER
     )
 
     USERNAME_FIELD = 'phone'
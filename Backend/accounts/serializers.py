@@ -3,6 +3,9 @@ from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 from accounts.models import CustomUser
 
+UPPERCASE_REGEX = re.compile(r'[A-Z]')
+SPECIAL_CHARACTER_REGEX = re.compile(r'[\W_]')
+
 class UserSerializer(serializers.ModelSerializer):
     phone = serializers.CharField(required=True, validators=[UniqueValidator(queryset=CustomUser.objects.all())])
     password = serializers.CharField(write_only=True, required=True)
@@ -21,9 +24,9 @@ class UserSerializer(serializers.ModelSerializer):
     def validate_password(self, value):
         if len(value) < 8:
             raise serializers.ValidationError("Password must be at least 8 characters long.")
-        if not re.search(r'[A-Z]', value):
+        if not UPPERCASE_REGEX.search(value):
             raise serializers.ValidationError("Password must contain at least one uppercase letter.")
-        if not re.search(r'[\W_]', value):
+        if not SPECIAL_CHARACTER_REGEX.search(value):
             raise serializers.ValidationError("Password must contain at least one special character.")
         return value
 
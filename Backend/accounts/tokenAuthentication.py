@@ -3,7 +3,7 @@ from jwt.exceptions import InvalidTokenError, ExpiredSignatureError
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 from django.conf import settings
-from django.contrib.auth.models import User
+from django.contrib.auth import get_user_model
 from datetime import datetime, timedelta
 
 class JWTAuthentication(BaseAuthentication):
@@ -15,9 +15,12 @@ class JWTAuthentication(BaseAuthentication):
         token = jwt.encode(payload, key=settings.SECRET_KEY, algorithm="HS256")
         return token
 
+    def authenticate_header(self, request):
+        # Makes DRF answer unauthenticated requests with 401 rather than 403
+        return 'Bearer'
+
     def authenticate(self, request):
         auth_header = request.headers.get('Authorization')
-        print(auth_header)
         if not auth_header:
             return None
 
@@ -26,16 +29,16 @@ class JWTAuthentication(BaseAuthentication):
             if token_type.lower() != 'bearer':
                 raise AuthenticationFailed('Invalid token type')
             
-            decoded_payload = jwt.decode(token, key=settings.SECRET_KEY, algorithms=["HS256"])
-            expiration = datetime.fromtimestamp(decoded_payload['exp'])
-            
-            if expiration < datetime.now():
-                raise AuthenticationFailed('Token has expired')
-            
+            # jwt.decode rejects expired tokens with ExpiredSignatureError, but only
+            # checks exp when it is present, so require the claim as well
+            decoded_payload = jwt.decode(token, key=settings.SECRET_KEY, algorithms=["HS256"],
+                                         options={"require": ["exp"]})
+
             user_id = decoded_payload.get('id')
             if not user_id:
                 raise AuthenticationFailed('Invalid token payload')
             
+            User = get_user_model()
             try:
                 user = User.objects.get(id=user_id)
             except User.DoesNotExist:
@@ -1,4 +1,3 @@
-from sqlite3 import Cursor
 from django.forms import ValidationError
 from accounts.models import CustomUser
 from accounts.serializers import *
@@ -6,7 +5,7 @@ from rest_framework import generics
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import permissions
-from django.contrib.auth import authenticate, login
+from django.contrib.auth import authenticate
 from rest_framework import status
 from .tokenAuthentication import JWTAuthentication
 from rest_framework.exceptions import ValidationError as DRFValidationError
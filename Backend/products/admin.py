@@ -1,8 +1,14 @@
 from django.contrib import admin
 from .models import Seller, Review, Product, Category
 
+
+class ReviewAdmin(admin.ModelAdmin):
+    # Review.__str__ reads product.title for every row in the changelist
+    list_select_related = ('product',)
+
+
 # Register your models here.
 admin.site.register(Seller)
-admin.site.register(Review)
+admin.site.register(Review, ReviewAdmin)
 admin.site.register(Product)
-admin.site.register(Category)
\ No newline at end of file
+admin.site.register(Category)
@@ -0,0 +1,21 @@
+import hashlib
+import time
+from django.core.cache import cache
+
+LIST_CACHE_TIMEOUT = 60 * 5
+
+
+def list_cache_key(prefix, request):
+    """
+    Build the cache key for a list response. The key embeds the prefix's
+    current generation, so changing it retires every cached page at once.
+    """
+    generation = cache.get_or_set(f'{prefix}:generation', time.time_ns, None)
+    path_hash = hashlib.blake2b(request.build_absolute_uri().encode(), digest_size=16).hexdigest()
+    return f'{prefix}:{generation}:{path_hash}'
+
+
+def invalidate_list_cache(prefix):
+    # Generations are timestamps rather than a counter, so an evicted
+    # generation key can never restart at a value older pages were cached under
+    cache.set(f'{prefix}:generation', time.time_ns(), None)
@@ -0,0 +1,15 @@
+from django.db import models
+from django.db.models import Avg, Count
+from django.db.models.functions import Coalesce
+
+
+class ProductQuerySet(models.QuerySet):
+    def with_ratings(self):
+        """
+        Annotate each product with its average review rating and the number
+        of users who reviewed it, so lists don't query reviews per product.
+        """
+        return self.annotate(
+            avg_rating=Coalesce(Avg('review__product_rating'), 0.0),
+            user_count=Count('review__user', distinct=True),
+        )
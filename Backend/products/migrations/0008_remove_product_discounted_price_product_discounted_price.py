@@ -0,0 +1,23 @@
+# Generated by Django 5.0.6 on 2026-10-16 10:12
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0007_product_featured_image'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='product',
+            name='discounted_price',
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='discounted_price',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(discount_percentage__gt=0, then=django.db.models.expressions.CombinedExpression(models.F('price'), '-', django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.F('price'), '*', models.F('discount_percentage')), '/', models.Value(100)))), default=None), null=True, output_field=models.DecimalField(decimal_places=2, max_digits=10)),
+        ),
+    ]
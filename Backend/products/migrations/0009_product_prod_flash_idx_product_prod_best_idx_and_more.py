@@ -0,0 +1,29 @@
+# Generated by Django 5.0.6 on 2026-10-16 10:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0008_remove_product_discounted_price_product_discounted_price'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['flash_sale'], name='prod_flash_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['best_seller_product'], name='prod_best_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['featured_product'], name='prod_feat_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['is_active', 'category'], name='prod_active_category_idx'),
+        ),
+    ]
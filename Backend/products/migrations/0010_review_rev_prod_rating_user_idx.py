@@ -0,0 +1,17 @@
+# Generated by Django 5.0.6 on 2026-10-16 11:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0009_product_prod_flash_idx_product_prod_best_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['product', 'product_rating', 'user'], name='rev_prod_rating_user_idx'),
+        ),
+    ]
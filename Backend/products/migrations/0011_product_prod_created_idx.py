@@ -0,0 +1,17 @@
+# Generated by Django 5.0.6 on 2026-10-16 14:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0010_review_rev_prod_rating_user_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['created_at'], name='prod_created_idx'),
+        ),
+    ]
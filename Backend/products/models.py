@@ -1,6 +1,7 @@
 from django.db import models
 from django.utils.text import slugify
 from accounts.models import CustomUser
+from .managers import ProductQuerySet
 
 class Seller(models.Model):
     name = models.CharField(max_length=256)
@@ -27,7 +28,18 @@ class Product(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2)
     featured_image = models.ImageField(upload_to='product_images', default='users/person.png')
     discount_percentage = models.DecimalField(max_digits=5, decimal_places=2, default=0.0, blank=True)
-    discounted_price = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
+    discounted_price = models.GeneratedField(
+        expression=models.Case(
+            models.When(
+                discount_percentage__gt=0,
+                then=models.F('price') - models.F('price') * models.F('discount_percentage') / 100,
+            ),
+            default=None,
+        ),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+        db_persist=True,
+        null=True,
+    )
     slug = models.SlugField(max_length=255, unique=True, blank=True)
     flash_sale = models.BooleanField(default=False)
     best_seller_product = models.BooleanField(default=False)
@@ -35,13 +47,20 @@ class Product(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ProductQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['flash_sale'], name='prod_flash_idx'),
+            models.Index(fields=['best_seller_product'], name='prod_best_idx'),
+            models.Index(fields=['featured_product'], name='prod_feat_idx'),
+            models.Index(fields=['is_active', 'category'], name='prod_active_category_idx'),
+            models.Index(fields=['created_at'], name='prod_created_idx'),
+        ]
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
-        if self.discount_percentage > 0:
-            self.discounted_price = self.price - (self.price * self.discount_percentage / 100)
-        else:
-            self.discounted_price = None
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -58,15 +77,14 @@ class Inventory(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
 class Review(models.Model):
-    ONE_TO_FIVE_RATING_CHOICES = (
-        (1, '1'),
-        (2, '2'),
-        (3, '3'),
-        (4, '4'),
-        (5, '5'),
-    )
+    class Rating(models.IntegerChoices):
+        ONE = 1, '1'
+        TWO = 2, '2'
+        THREE = 3, '3'
+        FOUR = 4, '4'
+        FIVE = 5, '5'
 
-    product_rating = models.IntegerField(choices=ONE_TO_FIVE_RATING_CHOICES)
+    product_rating = models.IntegerField(choices=Rating.choices)
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -74,6 +92,10 @@ class Review(models.Model):
 
     class Meta:
         unique_together = ('user', 'product')
+        indexes = [
+            # Covers both aggregates in Product.objects.with_ratings()
+            models.Index(fields=['product', 'product_rating', 'user'], name='rev_prod_rating_user_idx'),
+        ]
 
     def __str__(self):
         return f'{self.product.title}'
@@ -0,0 +1,15 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class CustomPagination(PageNumberPagination):
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class ProductCursorPagination(CursorPagination):
+    # Newest first; id breaks ties between products created in the same instant
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
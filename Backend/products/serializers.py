@@ -1,7 +1,12 @@
+from operator import attrgetter, itemgetter
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.utils.text import slugify
 from rest_framework import serializers
+from rest_framework.fields import SkipField, empty
 from .models import Seller, Category, Product, Review
+from .cache import invalidate_list_cache
 from accounts.models import CustomUser
-from django.db.models import Avg, Count
 
 class SellerSerializer(serializers.ModelSerializer):
     class Meta:
@@ -21,9 +26,136 @@ class ReviewSerializer(serializers.ModelSerializer):
         model = Review
         fields = ['product', 'user', 'product_rating']
 
+class ProductListSerializer(serializers.ListSerializer):
+    """
+    Works out how to read and render each of the child's fields once per list,
+    then builds every row from plain attribute reads instead of going through
+    DRF's per-field get_attribute() for each product. Rows may also be dicts
+    from QuerySet.values(), keyed by each field's source.
+    """
+
+    def get_model_field(self, name):
+        try:
+            return self.child.Meta.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+
+    def get_column(self, field, from_dicts=False):
+        """
+        Return (name, getter, to_representation) for one of the child's
+        readable fields. A to_representation of None emits the value as-is.
+        """
+        simple_source = len(field.source_attrs) == 1
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            if simple_source and field.pk_field is None:
+                if from_dicts:
+                    # values() returns the related primary key under the field name
+                    return field.field_name, itemgetter(field.source), None
+                attname = self.get_model_field(field.source).attname
+                return field.field_name, attrgetter(attname), None
+        # DRF marks a missing default with the `empty` class, which is callable
+        elif (simple_source and (field.default is empty or not callable(field.default))
+                and not isinstance(field, (serializers.RelatedField, serializers.ManyRelatedField,
+                                           serializers.BaseSerializer))):
+            source, default = field.source_attrs[0], field.default
+            to_representation = field.to_representation
+            if not from_dicts:
+                if default is empty:
+                    getter = attrgetter(source)
+                else:
+                    getter = lambda instance: getattr(instance, source, default)
+                return field.field_name, getter, to_representation
+
+            getter = itemgetter(source) if default is empty else lambda row: row.get(source, default)
+            model_field = self.get_model_field(source)
+            if isinstance(model_field, models.FileField):
+                # values() returns the stored file name; wrap it so the URL renders as usual
+                to_representation = lambda name: field.to_representation(
+                    model_field.attr_class(None, model_field, name))
+            return field.field_name, getter, to_representation
+        return field.field_name, field.get_attribute, field.to_representation
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        instances = list(iterable)
+        from_dicts = bool(instances) and isinstance(instances[0], dict)
+        readable_fields = [field for field in self.child.fields.values() if not field.write_only]
+        columns = [self.get_column(field, from_dicts) for field in readable_fields]
+
+        rows = []
+        for instance in instances:
+            row = {}
+            for name, getter, to_representation in columns:
+                try:
+                    value = getter(instance)
+                except SkipField:
+                    continue
+                if value is None or to_representation is None:
+                    row[name] = value
+                else:
+                    row[name] = to_representation(value)
+            rows.append(row)
+        return rows
+
+    def validate(self, attrs):
+        """
+        UniqueValidator only checks rows already in the database, so reject
+        duplicates within the payload before bulk_create() hits the constraint.
+        Slugs generated from titles are never seen by UniqueValidator, so they
+        are also checked against existing products.
+        """
+        unique_values = {
+            'title': lambda item: item['title'],
+            'product_number': lambda item: item['product_number'],
+            'slug': lambda item: item.get('slug') or slugify(item['title']),
+        }
+        errors = {}
+        for name, get_value in unique_values.items():
+            seen = set()
+            for item in attrs:
+                # Compare case-insensitively, like the database collation
+                value = get_value(item).casefold()
+                if value in seen:
+                    errors[name] = [f'Duplicate {name} "{get_value(item)}" in the request.']
+                    break
+                seen.add(value)
+
+        generated_slugs = [slugify(item['title']) for item in attrs if not item.get('slug')]
+        if 'slug' not in errors and generated_slugs:
+            taken = self.child.Meta.model.objects.filter(slug__in=generated_slugs).values_list('slug', flat=True)
+            taken = list(taken[:1])
+            if taken:
+                errors['slug'] = [f'A product with slug "{taken[0]}" already exists.']
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
+
+    def create(self, validated_data):
+        """
+        Insert the products with bulk_create(). MySQL doesn't hand back the
+        new primary keys, so the rows are read back by product_number.
+        """
+        model = self.child.Meta.model
+        products = [model(**attrs) for attrs in validated_data]
+        for product in products:
+            # bulk_create() skips Product.save(), which fills in the slug
+            if not product.slug:
+                product.slug = slugify(product.title)
+        model.objects.bulk_create(products, batch_size=500)
+        # No post_save signals are sent either
+        invalidate_list_cache('products')
+
+        created = model.objects.with_ratings().in_bulk(
+            [product.product_number for product in products], field_name='product_number')
+        return [created[product.product_number] for product in products]
+
+
 class ProductSerializer(serializers.ModelSerializer):
-    average_rating = serializers.SerializerMethodField()
-    user_count = serializers.SerializerMethodField()
+    discounted_price = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
+    # Both are annotated by Product.objects.with_ratings(); a product that was
+    # just created has no reviews and falls back to the defaults.
+    average_rating = serializers.FloatField(source='avg_rating', read_only=True, default=0)
+    user_count = serializers.IntegerField(read_only=True, default=0)
 
     class Meta:
         model = Product
@@ -33,13 +165,15 @@ class ProductSerializer(serializers.ModelSerializer):
             'slug', 'flash_sale', 'best_seller_product', 'featured_product',
             'average_rating', 'user_count', 'featured_image'
         ]
+        list_serializer_class = ProductListSerializer
 
-    def get_average_rating(self, obj):
-        reviews = Review.objects.filter(product=obj)
-        if reviews.exists():
-            average_rating = reviews.aggregate(average_rating=Avg('product_rating'))['average_rating']
-            return average_rating if average_rating is not None else 0
-        return 0
+    def create(self, validated_data):
+        product = super().create(validated_data)
+        # discounted_price is computed by the database on write
+        product.refresh_from_db(fields=['discounted_price'])
+        return product
 
-    def get_user_count(self, obj):
-        return Review.objects.filter(product=obj).values('user').distinct().count()
+    def update(self, instance, validated_data):
+        product = super().update(instance, validated_data)
+        product.refresh_from_db(fields=['discounted_price'])
+        return product
@@ -0,0 +1,20 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .cache import invalidate_list_cache
+from .models import Seller, Category, Product, Review
+
+
+@receiver([post_save, post_delete], sender=Product)
+@receiver([post_save, post_delete], sender=Review)
+def invalidate_product_list_cache(sender, **kwargs):
+    invalidate_list_cache('products')
+
+
+@receiver([post_save, post_delete], sender=Seller)
+def invalidate_seller_list_cache(sender, **kwargs):
+    invalidate_list_cache('sellers')
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_category_list_cache(sender, **kwargs):
+    invalidate_list_cache('categories')
@@ -1,3 +1,107 @@
+from decimal import Decimal
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework import serializers
+from rest_framework.test import APIRequestFactory
+from accounts.models import CustomUser
+from accounts.tokenAuthentication import JWTAuthentication
+from .models import Seller, Category, Product, Review
+from .serializers import ProductSerializer
 
-# Create your tests here.
+
+class ProductFixturesMixin:
+    @classmethod
+    def setUpTestData(cls):
+        seller = Seller.objects.create(name='Seller', description='Sells things', shop_logo='logo/seller.png')
+        category = Category.objects.create(name='Category', image='category/category.png')
+        cls.discounted = Product.objects.create(
+            title='Discounted', product_number='P1', seller=seller, category=category,
+            price=Decimal('100.00'), discount_percentage=Decimal('10.00'), flash_sale=True,
+            featured_image='product_images/discounted.png',
+        )
+        cls.plain = Product.objects.create(
+            title='Plain', description='No discount', product_number='P2', seller=seller,
+            category=category, price=Decimal('20.00'), featured_image='',
+        )
+        user = CustomUser.objects.create_user('923001234567', 'Password1!')
+        Review.objects.create(user=user, product=cls.discounted, product_rating=Review.Rating.FOUR)
+
+
+class ProductListSerializerTests(ProductFixturesMixin, TestCase):
+    def setUp(self):
+        self.context = {'request': APIRequestFactory().get('/api/products/')}
+
+    def stock_data(self, products):
+        return serializers.ListSerializer(child=ProductSerializer(), instance=products, context=self.context).data
+
+    def test_instances_match_stock_list_serializer(self):
+        products = Product.objects.with_ratings().order_by('id')
+        data = ProductSerializer(products, many=True, context=self.context).data
+        self.assertEqual(data, self.stock_data(products))
+
+    def test_values_rows_match_stock_list_serializer(self):
+        products = Product.objects.with_ratings().order_by('id')
+        sources = [field.source for field in ProductSerializer().fields.values()]
+        data = ProductSerializer(products.values(*sources), many=True, context=self.context).data
+        self.assertEqual(data, self.stock_data(products))
+
+    def test_instances_without_annotations_use_defaults(self):
+        data = ProductSerializer(Product.objects.order_by('id'), many=True, context=self.context).data
+        self.assertEqual([row['average_rating'] for row in data], [0, 0])
+        self.assertEqual([row['user_count'] for row in data], [0, 0])
+
+
+class ProductViewTests(ProductFixturesMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_list_renders_absolute_image_urls(self):
+        response = self.client.get('/api/products/')
+        self.assertEqual(response.status_code, 200)
+        images = {row['title']: row['featured_image'] for row in response.json()['results']}
+        self.assertEqual(images, {
+            'Discounted': 'http://testserver/media/product_images/discounted.png',
+            'Plain': None,
+        })
+
+    def test_anonymous_writes_are_unauthorized(self):
+        response = self.client.post('/api/products/', {}, content_type='application/json')
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response['WWW-Authenticate'], 'Bearer')
+
+    def post_as_user(self, data):
+        user = CustomUser.objects.get(phone='923001234567')
+        token = JWTAuthentication.generate_token({'id': user.id})
+        return self.client.post('/api/products/', data, content_type='application/json',
+                                HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_bulk_create_rejects_duplicates_within_the_payload(self):
+        product = {
+            'title': 'Twin', 'product_number': 'P3', 'price': '5.00',
+            'seller': self.plain.seller_id, 'category': self.plain.category_id,
+        }
+        response = self.post_as_user([product, dict(product, title='twin', product_number='P4')])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()), {'title', 'slug'})
+        self.assertFalse(Product.objects.filter(product_number__in=['P3', 'P4']).exists())
+
+    def test_bulk_create_rejects_generated_slugs_that_exist(self):
+        product = {
+            'title': 'Plain!', 'product_number': 'P3', 'price': '5.00',
+            'seller': self.plain.seller_id, 'category': self.plain.category_id,
+        }
+        response = self.post_as_user([product, dict(product, title='Other', product_number='P4')])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()), {'slug'})
+        self.assertFalse(Product.objects.filter(product_number__in=['P3', 'P4']).exists())
+
+    def test_bulk_create_inserts_every_product(self):
+        product = {'price': '5.00', 'seller': self.plain.seller_id, 'category': self.plain.category_id}
+        response = self.post_as_user([
+            dict(product, title='First', product_number='P3'),
+            dict(product, title='Second', product_number='P4', price='5.50', discount_percentage='50.00'),
+        ])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([row['slug'] for row in response.json()], ['first', 'second'])
+        self.assertEqual([row['discounted_price'] for row in response.json()], [None, '2.75'])
+        self.assertTrue(all(row['id'] for row in response.json()))
@@ -1,194 +1,116 @@
-from rest_framework.views import APIView
+import functools
+from django.core.cache import cache
+from rest_framework import generics
+from rest_framework import permissions
 from rest_framework.response import Response
 from rest_framework import status
 from .models import Seller, Category, Product
 from .serializers import SellerSerializer, CategorySerializer, ProductSerializer
-
-
-class SellerView(APIView):
-    def get(self, request):
-        try:
-            sellers = Seller.objects.all()
-            serializer = SellerSerializer(sellers, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-    def post(self, request):
-        try:
-            serializer = SellerSerializer(data=request.data)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-
-class SellerDetailView(APIView):
-    def put(self, request, id):
-        try:
-            try:
-                seller = Seller.objects.get(id=id)
-            except Seller.DoesNotExist:
-                return Response({'error': 'Seller not found'}, status=status.HTTP_404_NOT_FOUND)
-
-            serializer = SellerSerializer(
-                seller, data=request.data, partial=True)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-
-    def get(self, request, id):
-        try:
-            seller = Seller.objects.get(id=id)
-            serializer = SellerSerializer(seller)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Seller.DoesNotExist:
-            return Response({'error': 'Seller not found'}, status=status.HTTP_404_NOT_FOUND)
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
-    def delete(self, request, id):
-        try:
-            seller = Seller.objects.get(id=id)
-            seller.delete()
-            return Response({'message': 'Seller deleted successfully'}, status=status.HTTP_204_NO_CONTENT)
-        except Seller.DoesNotExist:
-            return Response({'error': 'Seller not found'}, status=status.HTTP_404_NOT_FOUND)
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
-
-class CategoryView(APIView):
-    def get(self, request):
-        try:
-            category = Category.objects.all()
-            serializer = CategorySerializer(category, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-    def post(self, request):
-        try:
-            serializer = CategorySerializer(data=request.data)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-
-class CategoryDetailView(APIView):
-    def put(self, request, id):
-        try:
-            try:
-                category = Category.objects.get(id=id)
-            except Category.DoesNotExist:
-                return Response({'error': 'category not found'}, status=status.HTTP_404_NOT_FOUND)
-
-            serializer = CategorySerializer(
-                category, data=request.data, partial=True)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-
-    def get(self, request, id):
-        try:
-            category = Category.objects.get(id=id)
-            serializer = CategorySerializer(category)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Category.DoesNotExist:
-            return Response({'error': 'Category not found'}, status=status.HTTP_404_NOT_FOUND)
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
-    def delete(self, request, id):
-        try:
-            category = Category.objects.get(id=id)
-            category.delete()
-            return Response({'message': 'Category deleted successfully'}, status=status.HTTP_204_NO_CONTENT)
-        except Category.DoesNotExist:
-            return Response({'error': 'Category not found'}, status=status.HTTP_404_NOT_FOUND)
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
-
-class ProductView(APIView):
-    def get(self, request):
-        try:
-            flash_sale = request.query_params.get('flash_sale')
-            best_seller_product = request.query_params.get('best_seller_product')
-            featured_product = request.query_params.get('featured_product')
-
-            products = Product.objects.all()
-
-            if flash_sale is not None:
-                products = products.filter(flash_sale=flash_sale.lower() == 'true')
-            if best_seller_product is not None:
-                products = products.filter(best_seller_product=best_seller_product.lower() == 'true')
-            if featured_product is not None:
-                products = products.filter(featured_product=featured_product.lower() == 'true')
-
-            serializer = ProductSerializer(products, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-    def post(self, request):
-        try:
-            serializer = ProductSerializer(data=request.data)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-class ProductDetailView(APIView):
-    def put(self, request, id):
-        try:
-            try:
-                product = Product.objects.get(id=id)
-            except Product.DoesNotExist:
-                return Response({'error': 'Product not found'}, status=status.HTTP_404_NOT_FOUND)
-
-            serializer = ProductSerializer(product, data=request.data, partial=True)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-    def get(self, request, id):
-        try:
-            product = Product.objects.get(id=id)
-            serializer = ProductSerializer(product)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Product.DoesNotExist:
-            return Response({'error': 'Product not found'}, status=status.HTTP_404_NOT_FOUND)
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-    def delete(self, request, id):
-        try:
-            product = Product.objects.get(id=id)
-            product.delete()
-            return Response({'message': 'Product deleted successfully'}, status=status.HTTP_204_NO_CONTENT)
-        except Product.DoesNotExist:
-            return Response({'error': 'Product not found'}, status=status.HTTP_404_NOT_FOUND)
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+from .pagination import CustomPagination, ProductCursorPagination
+from .cache import LIST_CACHE_TIMEOUT, list_cache_key
+
+
+class CachedListMixin:
+    """
+    Serves anonymous list requests from the cache under `cache_prefix`.
+    """
+    cache_prefix = None
+
+    def list(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().list(request, *args, **kwargs)
+
+        cache_key = list_cache_key(self.cache_prefix, request)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached, status=status.HTTP_200_OK)
+
+        response = super().list(request, *args, **kwargs)
+        cache.set(cache_key, response.data, LIST_CACHE_TIMEOUT)
+        return response
+
+
+class DetailView(generics.RetrieveUpdateDestroyAPIView):
+    """
+    Detail endpoint looked up by the `id` URL kwarg. PUT keeps its partial
+    update semantics and 202 status.
+    """
+    lookup_url_kwarg = 'id'
+    permission_classes = (permissions.IsAuthenticatedOrReadOnly,)
+
+    def get_queryset(self):
+        if self.request.method == 'DELETE':
+            # Deleting only needs the primary key
+            return self.queryset.model.objects.only('id')
+        return super().get_queryset()
+
+    def update(self, request, *args, **kwargs):
+        kwargs['partial'] = True
+        response = super().update(request, *args, **kwargs)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return response
+
+
+class SellerView(CachedListMixin, generics.ListCreateAPIView):
+    permission_classes = (permissions.IsAuthenticatedOrReadOnly,)
+    queryset = Seller.objects.order_by('id')
+    serializer_class = SellerSerializer
+    pagination_class = CustomPagination
+    cache_prefix = 'sellers'
+
+
+class SellerDetailView(DetailView):
+    queryset = Seller.objects.all()
+    serializer_class = SellerSerializer
+
+
+class CategoryView(CachedListMixin, generics.ListCreateAPIView):
+    permission_classes = (permissions.IsAuthenticatedOrReadOnly,)
+    queryset = Category.objects.order_by('id')
+    serializer_class = CategorySerializer
+    pagination_class = CustomPagination
+    cache_prefix = 'categories'
+
+
+class CategoryDetailView(DetailView):
+    queryset = Category.objects.all()
+    serializer_class = CategorySerializer
+
+
+class ProductView(CachedListMixin, generics.ListCreateAPIView):
+    permission_classes = (permissions.IsAuthenticatedOrReadOnly,)
+    serializer_class = ProductSerializer
+    pagination_class = ProductCursorPagination
+    cache_prefix = 'products'
+
+    @classmethod
+    @functools.cache
+    def get_list_values(cls):
+        """
+        Columns selected for list rows: the source of each readable serializer
+        field, plus created_at for the cursor.
+        """
+        fields = cls.serializer_class().fields.values()
+        return tuple(field.source for field in fields if not field.write_only) + ('created_at',)
+
+    def get_queryset(self):
+        products = Product.objects.with_ratings()
+        for flag in ('flash_sale', 'best_seller_product', 'featured_product'):
+            value = self.request.query_params.get(flag)
+            if value is not None:
+                products = products.filter(**{flag: value.lower() == 'true'})
+        if self.request.method == 'GET':
+            # Lists are rendered from plain dicts, skipping model instantiation
+            products = products.values(*self.get_list_values())
+        return products
+
+    def get_serializer(self, *args, **kwargs):
+        # A list payload creates every product in one bulk insert
+        if isinstance(kwargs.get('data'), list):
+            kwargs['many'] = True
+        return super().get_serializer(*args, **kwargs)
+
+
+class ProductDetailView(DetailView):
+    queryset = Product.objects.with_ratings()
+    serializer_class = ProductSerializer
@@ -3,7 +3,6 @@ import "./productCard.css";
 import Rating from "@mui/material/Rating";
 import ShoppingCartOutlinedIcon from "@mui/icons-material/ShoppingCartOutlined";
 import ShoppingCartIcon from "@mui/icons-material/ShoppingCart";
-import API_URL from "../../constant";
 
 const ProductCard = ({
   title,
@@ -30,7 +29,7 @@ const ProductCard = ({
       <div className="favoriteIcon" onClick={handleFavoriteClick}>
         {isFavorite ? <ShoppingCartIcon /> : <ShoppingCartOutlinedIcon />}
       </div>
-      <img src={`${API_URL}` + image} alt={title} className="productImage" />
+      <img src={image} alt={title} className="productImage" />
       <p className="productName">{title}</p>
       <div className="productPrice">
         {current_price ? (
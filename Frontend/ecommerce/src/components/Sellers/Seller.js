@@ -8,7 +8,6 @@ import TableContainer from "@mui/material/TableContainer";
 import TableHead from "@mui/material/TableHead";
 import TableRow from "@mui/material/TableRow";
 import Paper from "@mui/material/Paper";
-import API_URL from "../../constant";
 
 export default function Seller() {
   const dispatch = useDispatch();
@@ -42,7 +41,7 @@ export default function Seller() {
                 <TableCell align="left">{seller.description}</TableCell>
                 <TableCell align="left">
                   <img
-                    src={`${API_URL}${seller.shop_logo}`}
+                    src={seller.shop_logo}
                     alt="store-image"
                     style={{ maxWidth: "100px", maxHeight: "100px" }}
                   />
@@ -4,8 +4,16 @@ import API_URL from "../../constant";
 
 // When this action is dispatched, it will call the api
 export const fetchFlashSaleProducts = createAsyncThunk("productFlashSaleList", async () => {
-  const response = await fetch(`${API_URL}/api/products/?flash_sale=true`);
-  return response.json();
+  // The list is cursor paginated, so follow `next` until every page is loaded
+  const products = [];
+  let url = `${API_URL}/api/products/?flash_sale=true&page_size=100`;
+  while (url) {
+    const response = await fetch(url);
+    const data = await response.json();
+    products.push(...data.results);
+    url = data.next;
+  }
+  return products;
 });
 const flashSaleSlice = createSlice({
   name: "flashSale",
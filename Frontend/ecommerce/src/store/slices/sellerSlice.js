@@ -4,8 +4,16 @@ import API_URL from "../../constant";
 
 // When this action is dispatched, it will call the api
 export const fetchSeller = createAsyncThunk("sellerList", async () => {
-  const response = await fetch(`${API_URL}/api/sellers/`);
-  return response.json();
+  // The list is paginated, so follow `next` until every page is loaded
+  const sellers = [];
+  let url = `${API_URL}/api/sellers/?page_size=100`;
+  while (url) {
+    const response = await fetch(url);
+    const data = await response.json();
+    sellers.push(...data.results);
+    url = data.next;
+  }
+  return sellers;
 });
 const sellerSlice = createSlice({
   name: "seller",